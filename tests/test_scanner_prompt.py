@@ -0,0 +1,70 @@
+import importlib.util
+from pathlib import Path
+from typing import Any, List
+
+# Loaded straight from its file: scanner_prompt has no imports outside the standard library, while
+# importing it through the workflow package would pull in vellum and vellum_ee.
+_SPEC = importlib.util.spec_from_file_location(
+    "scanner_prompt", Path(__file__).resolve().parents[1] / "vellum-SDK" / "nodes" / "scanner_prompt.py"
+)
+scanner_prompt = importlib.util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(scanner_prompt)
+
+_SCANNER_FULL_SCHEMA = scanner_prompt._SCANNER_FULL_SCHEMA
+_SCANNER_WIRE_SCHEMA = scanner_prompt._SCANNER_WIRE_SCHEMA
+_strip_descriptions = scanner_prompt._strip_descriptions
+
+_STRUCTURAL_KEYS = ("type", "required", "enum", "$ref", "maxLength")
+
+
+def _mismatches(full: Any, wire: Any, location: str = "$") -> List[str]:
+    # Walks both schemas together and reports every place where the wire schema would let the model
+    # produce something the full schema doesn't describe.
+    if isinstance(full, list) or isinstance(wire, list):
+        return [] if full == wire else [location]
+    if not isinstance(full, dict) or not isinstance(wire, dict):
+        return [location]
+    found = [f"{location}.{key}" for key in _STRUCTURAL_KEYS if full.get(key) != wire.get(key)]
+    for key in ("properties", "$defs"):
+        full_children, wire_children = full.get(key, {}), wire.get(key, {})
+        if full_children.keys() != wire_children.keys():
+            found.append(f"{location}.{key}")
+        for name in full_children.keys() & wire_children.keys():
+            found.extend(_mismatches(full_children[name], wire_children[name], f"{location}.{key}.{name}"))
+    if "items" in full or "items" in wire:
+        found.extend(_mismatches(full.get("items"), wire.get("items"), f"{location}.items"))
+    return found
+
+
+def _doc_keys(schema: Any, location: str = "$") -> List[str]:
+    if not isinstance(schema, dict):
+        return []
+    found = [f"{location}.{key}" for key in ("title", "description") if key in schema]
+    for key in ("properties", "$defs"):
+        for name, child in schema.get(key, {}).items():
+            found.extend(_doc_keys(child, f"{location}.{key}.{name}"))
+    found.extend(_doc_keys(schema.get("items"), f"{location}.items"))
+    return found
+
+
+def test_wire_schema_keeps_required_fields_and_types():
+    assert _mismatches(_SCANNER_FULL_SCHEMA, _SCANNER_WIRE_SCHEMA) == []
+
+
+def test_wire_schema_drops_docs():
+    assert _doc_keys(_SCANNER_FULL_SCHEMA) != []
+    assert _doc_keys(_SCANNER_WIRE_SCHEMA) == []
+
+
+def test_strip_descriptions_keeps_properties_named_like_docs():
+    schema = {
+        "type": "object",
+        "description": "Documented object",
+        "properties": {"title": {"type": "string", "title": "Title"}, "description": {"type": "string"}},
+        "required": ["title", "description"],
+    }
+    assert _strip_descriptions(schema) == {
+        "type": "object",
+        "properties": {"title": {"type": "string"}, "description": {"type": "string"}},
+        "required": ["title", "description"],
+    }
@@ -0,0 +1,9 @@
+from functools import lru_cache
+
+from vellum_ee.workflows.display.editor import NodeDisplayData, NodeDisplayPosition
+
+
+@lru_cache(maxsize=None)
+def _nd(x: float, y: float, width: int, height: int) -> NodeDisplayData:
+    """Return the shared NodeDisplayData for a node at (x, y) with the given size."""
+    return NodeDisplayData(position=NodeDisplayPosition(x=x, y=y), width=width, height=height)
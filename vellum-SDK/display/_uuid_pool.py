@@ -0,0 +1,12 @@
+from typing import Dict
+from uuid import UUID
+
+_UUID_POOL: Dict[int, UUID] = {}
+
+
+def _uuid(value: int) -> UUID:
+    """Return the shared UUID instance for ``value``, creating it on first use."""
+    uuid = _UUID_POOL.get(value)
+    if uuid is None:
+        uuid = _UUID_POOL[value] = UUID(int=value)
+    return uuid
@@ -1,13 +1,25 @@
 from .file_list import FileListDisplay
+from .file_list_sharder import FileListSharderDisplay
 from .patcher import PatcherDisplay
+from .patcher_merge import PatcherMergeDisplay
 from .results import ResultsDisplay
+from .scan_cache_lookup import ScanCacheLookupDisplay
 from .scanned_files import ScannedFilesDisplay
 from .vuln_scanner import VulnScannerDisplay
+from .vuln_scanner_deep import VulnScannerDeepDisplay
+from .vuln_scanner_merge import VulnScannerMergeDisplay
+from .vuln_scanner_review import VulnScannerReviewDisplay
 
 __all__ = [
     "FileListDisplay",
+    "FileListSharderDisplay",
     "PatcherDisplay",
+    "PatcherMergeDisplay",
     "ResultsDisplay",
+    "ScanCacheLookupDisplay",
     "ScannedFilesDisplay",
     "VulnScannerDisplay",
+    "VulnScannerDeepDisplay",
+    "VulnScannerMergeDisplay",
+    "VulnScannerReviewDisplay",
 ]
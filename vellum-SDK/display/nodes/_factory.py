@@ -0,0 +1,12 @@
+import sys
+from functools import lru_cache
+
+from vellum_ee.workflows.display.nodes.types import NodeOutputDisplay
+
+from .._uuid_pool import _uuid
+
+
+@lru_cache(maxsize=None)
+def _out(id_int: int, name: str) -> NodeOutputDisplay:
+    """Return the shared NodeOutputDisplay for an output id and name."""
+    return NodeOutputDisplay(id=_uuid(id_int), name=sys.intern(name))
@@ -0,0 +1,57 @@
+from typing import Dict, Tuple
+from uuid import UUID
+
+from .._uuid_pool import _uuid
+
+# Input and attribute ids for every node display, keyed by (node_id.int, name). Each display
+# class takes its slice once at class creation via _by_name().
+NODE_INPUT_IDS: Dict[Tuple[int, str], UUID] = {
+    # FilePatcher
+    (0x2BBD4367_E76D_47D0_A4B9_14FE2F1AD256, "prompt_inputs.FileRisk"): _uuid(0xE24CEAFE_618D_4133_B946_EC2BF76AEB97),
+    # Patcher
+    (0x958E9E29_F40C_4F64_B66F_3B4577C906AB, "items"): _uuid(0x0B5F09A5_BA63_44DE_B379_FA6822DE80A3),
+    # VulnScanner
+    (0x70C7E57B_9824_4F1C_8D2B_F09BC43F036D, "items"): _uuid(0x76D11F3E_3A81_4F51_A39F_57AE7875BEF3),
+    # VulnScannerDeep
+    (0x74AF239A_5248_4215_81C7_E31DA9989243, "items"): _uuid(0xF60D791E_22CD_43A8_8B35_24C78B581058),
+    # VulnScannerDeepBatch
+    (0x47BDE388_D9B0_4E96_B6C5_AA0ED312FC8A, "prompt_inputs.candidates"): _uuid(0x42071768_91C9_4B29_B5F0_F6247E89F80A),
+    # VulnScannerShard
+    (0xAEFD58E7_6713_480F_8486_67F87A3DA4E4, "prompt_inputs.fileList"): _uuid(0x85056102_0920_46BD_A3FD_E84E31964010),
+}
+
+ATTRIBUTE_IDS: Dict[Tuple[int, str], UUID] = {
+    # FileList
+    (0xABB1264E_59E4_45D7_A413_D27ED2B653D8, "file_tree"): _uuid(0xF0A25AD1_D313_4D6B_9CB7_F42703F99861),
+    # FileListSharder
+    (0xE177BF04_7B45_452B_8778_7E422789A8DA, "files"): _uuid(0xDD76CE2F_C958_4708_8430_6013478103DF),
+    (0xE177BF04_7B45_452B_8778_7E422789A8DA, "shard_size"): _uuid(0x60C63F8D_A75B_4F73_B3C6_9D368E8E3E1C),
+    # FilePatcher
+    (0x2BBD4367_E76D_47D0_A4B9_14FE2F1AD256, "ml_model"): _uuid(0xC3F5FFDE_75E1_46E3_8E46_C520EFAF7833),
+    # PatcherMerge
+    (0x5896F3B3_F370_4E3C_A4FD_59A062FE8372, "fix_results"): _uuid(0x2BFCBFE7_9E2B_42E7_8A5E_01FA54AB11E9),
+    # VulnScannerMerge
+    (0x7A6D4520_7EF3_4858_9A5A_4085F04A418A, "shard_results"): _uuid(0x868E36A9_866B_4AEA_BCC3_50BD0668F899),
+    (0x7A6D4520_7EF3_4858_9A5A_4085F04A418A, "cache_keys"): _uuid(0x89874D51_054C_4375_BE8F_B026C3DCFC32),
+    (0x7A6D4520_7EF3_4858_9A5A_4085F04A418A, "cached_result"): _uuid(0x4D5FD7A8_2E5A_4013_8301_9573744E12E7),
+    (0x7A6D4520_7EF3_4858_9A5A_4085F04A418A, "duplicates"): _uuid(0x55AA18EA_EE2C_46A7_B392_2762A0A2444D),
+    (0x7A6D4520_7EF3_4858_9A5A_4085F04A418A, "prefiltered_ignored"): _uuid(0x07D0BBB2_E033_4870_B516_55F2F2D41F77),
+    (0x7A6D4520_7EF3_4858_9A5A_4085F04A418A, "prefiltered_low_risk"): _uuid(0xB25EBD20_AD5E_42C4_AEA0_15709A098E72),
+    (0x7A6D4520_7EF3_4858_9A5A_4085F04A418A, "files"): _uuid(0x22A4165A_C61B_40C7_BD8B_45EA8982746A),
+    # ScanCacheLookup
+    (0xF82988DD_5561_4206_9D30_F644A1B1DFE7, "files"): _uuid(0x6E14BB35_6EF3_4911_A40F_F3A2B2537982),
+    # VulnScannerDeepBatch
+    (0x47BDE388_D9B0_4E96_B6C5_AA0ED312FC8A, "ml_model"): _uuid(0x9DEC3BDC_26CE_4E8F_9F14_4CC917171A3B),
+    # VulnScannerReview
+    (0x29384CDC_7300_4FE4_96AC_2CDAE1ED005E, "scan"): _uuid(0xA61D9558_B4BC_497F_BC58_14FD54332014),
+    (0x29384CDC_7300_4FE4_96AC_2CDAE1ED005E, "deep_results"): _uuid(0x786DFC53_33BC_4BE4_BD0A_F3B753E4C364),
+    (0x29384CDC_7300_4FE4_96AC_2CDAE1ED005E, "duplicates"): _uuid(0x983DB770_7FA2_48CF_BA88_A4A0C3C97137),
+    (0x29384CDC_7300_4FE4_96AC_2CDAE1ED005E, "deep_keys"): _uuid(0xAC3972D0_3A14_4647_A620_C84B03DF8EF9),
+    (0x29384CDC_7300_4FE4_96AC_2CDAE1ED005E, "cached_verdicts"): _uuid(0x088836E7_F387_49A8_853D_10021CFC7D12),
+    # VulnScannerShard
+    (0xAEFD58E7_6713_480F_8486_67F87A3DA4E4, "ml_model"): _uuid(0xB19EFEBB_973A_495E_B1A3_EBBA5982EDF8),
+}
+
+
+def _by_name(table: Dict[Tuple[int, str], UUID], node_id: UUID) -> Dict[str, UUID]:
+    return {name: id for (owner, name), id in table.items() if owner == node_id.int}
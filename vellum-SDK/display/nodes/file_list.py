@@ -1,24 +1,23 @@
-from uuid import UUID
-
-from vellum_ee.workflows.display.editor import NodeDisplayData, NodeDisplayPosition
-from vellum_ee.workflows.display.nodes import BaseTemplatingNodeDisplay
-from vellum_ee.workflows.display.nodes.types import NodeOutputDisplay, PortDisplayOverrides
+from vellum_ee.workflows.display.nodes import BaseNodeDisplay
+from vellum_ee.workflows.display.nodes.types import PortDisplayOverrides
 
 from ...nodes.file_list import FileList
+from .._cache import _nd
+from .._uuid_pool import _uuid
+from ._factory import _out
+from ._tables import ATTRIBUTE_IDS, _by_name
 
 
-class FileListDisplay(BaseTemplatingNodeDisplay[FileList]):
+class FileListDisplay(BaseNodeDisplay[FileList]):
     label = "FileList"
-    node_id = UUID("abb1264e-59e4-45d7-a413-d27ed2b653d8")
-    target_handle_id = UUID("2c9112d7-332e-4df6-baef-a081e6712a9d")
-    node_input_ids_by_name = {
-        "inputs.fileTree": UUID("f0a25ad1-d313-4d6b-9cb7-f42703f99861"),
-        "template": UUID("6c15f54d-109c-473c-80d3-b1c74f1b4dd9"),
-    }
+    node_id = _uuid(0xABB1264E_59E4_45D7_A413_D27ED2B653D8)
+    target_handle_id = _uuid(0x2C9112D7_332E_4DF6_BAEF_A081E6712A9D)
+    attribute_ids_by_name = _by_name(ATTRIBUTE_IDS, node_id)
     output_display = {
-        FileList.Outputs.result: NodeOutputDisplay(id=UUID("cd597e30-1fa0-4752-b7f0-f19af021a0fc"), name="result")
+        FileList.Outputs.result: _out(0xCD597E30_1FA0_4752_B7F0_F19AF021A0FC, "result"),
+        FileList.Outputs.duplicates: _out(0x3226327D_9A3F_4C27_9D67_2C9ECD0A9399, "duplicates"),
+        FileList.Outputs.ignored: _out(0x449B4626_00E5_4A3D_BAAF_3AFFC722982C, "ignored"),
+        FileList.Outputs.low_risk: _out(0xE0F7FD74_C7AC_4B52_9046_4D13C0CDD634, "low_risk"),
     }
-    port_displays = {FileList.Ports.default: PortDisplayOverrides(id=UUID("343a014a-d845-4c77-9277-0f7d1f8256c3"))}
-    display_data = NodeDisplayData(
-        position=NodeDisplayPosition(x=1741.343748459347, y=313.4047655080733), width=554, height=594
-    )
+    port_displays = {FileList.Ports.default: PortDisplayOverrides(id=_uuid(0x343A014A_D845_4C77_9277_0F7D1F8256C3))}
+    display_data = _nd(1741.343748459347, 313.4047655080733, 554, 594)
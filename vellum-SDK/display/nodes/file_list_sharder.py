@@ -0,0 +1,20 @@
+from vellum_ee.workflows.display.nodes import BaseNodeDisplay
+from vellum_ee.workflows.display.nodes.types import PortDisplayOverrides
+
+from ...nodes.file_list_sharder import FileListSharder
+from .._cache import _nd
+from .._uuid_pool import _uuid
+from ._factory import _out
+from ._tables import ATTRIBUTE_IDS, _by_name
+
+
+class FileListSharderDisplay(BaseNodeDisplay[FileListSharder]):
+    label = "FileList Sharder"
+    node_id = _uuid(0xE177BF04_7B45_452B_8778_7E422789A8DA)
+    target_handle_id = _uuid(0x1E63E46C_F684_445E_8102_680C5AFBE25A)
+    attribute_ids_by_name = _by_name(ATTRIBUTE_IDS, node_id)
+    output_display = {FileListSharder.Outputs.shards: _out(0xB49D0AF6_42D0_4F27_96B6_32BF9ACA7F5A, "shards")}
+    port_displays = {
+        FileListSharder.Ports.default: PortDisplayOverrides(id=_uuid(0x54C11B5C_1A6C_4FBE_9C05_7D1E4F99C41C))
+    }
+    display_data = _nd(2950, 394.11531880245286, 480, 240)
@@ -0,0 +1,22 @@
+# flake8: noqa: F401, F403
+
+from vellum_ee.workflows.display.nodes import BaseMapNodeDisplay
+from vellum_ee.workflows.display.nodes.types import PortDisplayOverrides
+
+from ....nodes.patcher import Patcher
+from ..._cache import _nd
+from ..._uuid_pool import _uuid
+from .._factory import _out
+from .._tables import NODE_INPUT_IDS, _by_name
+from .nodes import *
+from .workflow import *
+
+
+class PatcherDisplay(BaseMapNodeDisplay[Patcher]):
+    label = "Patcher"
+    node_id = _uuid(0x958E9E29_F40C_4F64_B66F_3B4577C906AB)
+    target_handle_id = _uuid(0xB97FF3CF_5107_4F7C_BD4B_F93F3F53FFFD)
+    node_input_ids_by_name = _by_name(NODE_INPUT_IDS, node_id)
+    output_display = {Patcher.Outputs.json: _out(0x466CBE31_792E_4A0E_9A79_C4F58E711501, "json")}
+    port_displays = {Patcher.Ports.default: PortDisplayOverrides(id=_uuid(0xDD77DA58_A164_4DCB_9D82_D9CB3A68B8AF))}
+    display_data = _nd(5900, 192.43908708361312, 554, 500)
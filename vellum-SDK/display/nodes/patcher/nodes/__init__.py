@@ -0,0 +1,5 @@
+from .file_patcher import FilePatcherDisplay
+
+__all__ = [
+    "FilePatcherDisplay",
+]
@@ -0,0 +1,25 @@
+from vellum_ee.workflows.display.nodes import BaseInlinePromptNodeDisplay
+from vellum_ee.workflows.display.nodes.types import PortDisplayOverrides
+
+from .....nodes.patcher.nodes.file_patcher import FilePatcher
+from ...._cache import _nd
+from ...._uuid_pool import _uuid
+from ..._factory import _out
+from ..._tables import ATTRIBUTE_IDS, NODE_INPUT_IDS, _by_name
+
+
+class FilePatcherDisplay(BaseInlinePromptNodeDisplay[FilePatcher]):
+    label = "File Patcher"
+    node_id = _uuid(0x2BBD4367_E76D_47D0_A4B9_14FE2F1AD256)
+    output_id = _uuid(0x7E8AA568_4962_474F_A706_EA0C030E83EF)
+    array_output_id = _uuid(0x92646E5A_BF11_43E0_86DB_D3BA484A291E)
+    target_handle_id = _uuid(0x1307ADDC_4B81_4FFA_A188_DABECEBB5521)
+    node_input_ids_by_name = _by_name(NODE_INPUT_IDS, node_id)
+    attribute_ids_by_name = _by_name(ATTRIBUTE_IDS, node_id)
+    output_display = {
+        FilePatcher.Outputs.text: _out(0x7E8AA568_4962_474F_A706_EA0C030E83EF, "text"),
+        FilePatcher.Outputs.results: _out(0x92646E5A_BF11_43E0_86DB_D3BA484A291E, "results"),
+        FilePatcher.Outputs.json: _out(0xEF4B4637_086B_4901_B40A_AB72749064FC, "json"),
+    }
+    port_displays = {FilePatcher.Ports.default: PortDisplayOverrides(id=_uuid(0xA6D36303_C1C9_4454_B67F_F9767A8334D7))}
+    display_data = _nd(2948.5335407611165, 192.43908708361312, 554, 500)
@@ -0,0 +1,42 @@
+from vellum_ee.workflows.display.base import (
+    EdgeDisplay,
+    EntrypointDisplay,
+    WorkflowDisplayData,
+    WorkflowDisplayDataViewport,
+    WorkflowInputsDisplay,
+    WorkflowMetaDisplay,
+    WorkflowOutputDisplay,
+)
+from vellum_ee.workflows.display.workflows import BaseWorkflowDisplay
+
+from ....nodes.patcher.inputs import Inputs
+from ....nodes.patcher.nodes.file_patcher import FilePatcher
+from ....nodes.patcher.workflow import PatcherWorkflow
+from ..._cache import _nd
+from ..._uuid_pool import _uuid
+
+
+class PatcherWorkflowDisplay(BaseWorkflowDisplay[PatcherWorkflow]):
+    workflow_display = WorkflowMetaDisplay(
+        entrypoint_node_id=_uuid(0x20E46899_EC69_45AE_A5D7_06D3947F1604),
+        entrypoint_node_source_handle_id=_uuid(0x419606EC_C653_4428_8034_58F95322A26B),
+        entrypoint_node_display=_nd(1560, 330, 124, 48),
+        display_data=WorkflowDisplayData(viewport=WorkflowDisplayDataViewport(x=-1200, y=0, zoom=0.75)),
+    )
+    inputs_display = {
+        Inputs.items: WorkflowInputsDisplay(id=_uuid(0xABEA043A_1323_4AD7_8332_BE20213C302C), name="items"),
+        Inputs.item: WorkflowInputsDisplay(id=_uuid(0x93614621_EC2F_4C1D_96E0_6E66912E3878), name="item"),
+        Inputs.index: WorkflowInputsDisplay(id=_uuid(0x3600C48A_B6A6_4FBC_9114_83A05AB6B64E), name="index"),
+    }
+    entrypoint_displays = {
+        FilePatcher: EntrypointDisplay(
+            id=_uuid(0x20E46899_EC69_45AE_A5D7_06D3947F1604),
+            edge_display=EdgeDisplay(id=_uuid(0xFBE96E42_D0F4_47B5_BD2E_B14DFC7CD0AA)),
+        )
+    }
+    edge_displays = {}
+    output_displays = {
+        PatcherWorkflow.Outputs.json: WorkflowOutputDisplay(
+            id=_uuid(0x466CBE31_792E_4A0E_9A79_C4F58E711501), name="json"
+        ),
+    }
@@ -0,0 +1,18 @@
+from vellum_ee.workflows.display.nodes import BaseNodeDisplay
+from vellum_ee.workflows.display.nodes.types import PortDisplayOverrides
+
+from ...nodes.patcher_merge import PatcherMerge
+from .._cache import _nd
+from .._uuid_pool import _uuid
+from ._factory import _out
+from ._tables import ATTRIBUTE_IDS, _by_name
+
+
+class PatcherMergeDisplay(BaseNodeDisplay[PatcherMerge]):
+    label = "Patcher Merge"
+    node_id = _uuid(0x5896F3B3_F370_4E3C_A4FD_59A062FE8372)
+    target_handle_id = _uuid(0x6EA7EA4C_FF21_4802_A196_FD677179B88B)
+    attribute_ids_by_name = _by_name(ATTRIBUTE_IDS, node_id)
+    output_display = {PatcherMerge.Outputs.json: _out(0xFB161A23_5FEC_4083_8454_BCC42EFBF7C2, "json")}
+    port_displays = {PatcherMerge.Ports.default: PortDisplayOverrides(id=_uuid(0x048B031F_A182_4BBC_9DDA_D32E227A1983))}
+    display_data = _nd(6500, 192.43908708361312, 480, 240)
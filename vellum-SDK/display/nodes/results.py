@@ -1,20 +1,15 @@
-from uuid import UUID
-
-from vellum_ee.workflows.display.editor import NodeDisplayData, NodeDisplayPosition
 from vellum_ee.workflows.display.nodes import BaseFinalOutputNodeDisplay
-from vellum_ee.workflows.display.nodes.types import NodeOutputDisplay
 
 from ...nodes.results import Results
+from .._cache import _nd
+from .._uuid_pool import _uuid
+from ._factory import _out
 
 
 class ResultsDisplay(BaseFinalOutputNodeDisplay[Results]):
     label = "Results"
-    node_id = UUID("654e00c1-6510-4861-a69c-de45be7c4db1")
-    target_handle_id = UUID("924e3ede-f370-4396-802d-ea547b2077a2")
+    node_id = _uuid(0x654E00C1_6510_4861_A69C_DE45BE7C4DB1)
+    target_handle_id = _uuid(0x924E3EDE_F370_4396_802D_EA547B2077A2)
     output_name = "results"
-    output_display = {
-        Results.Outputs.value: NodeOutputDisplay(id=UUID("e1d9a969-4041-46e6-8cb2-11f0726f2a14"), name="value")
-    }
-    display_data = NodeDisplayData(
-        position=NodeDisplayPosition(x=3623.620754536665, y=286.54588641797375), width=522, height=457
-    )
+    output_display = {Results.Outputs.value: _out(0xE1D9A969_4041_46E6_8CB2_11F0726F2A14, "value")}
+    display_data = _nd(7100, 286.54588641797375, 522, 457)
@@ -0,0 +1,24 @@
+from vellum_ee.workflows.display.nodes import BaseNodeDisplay
+from vellum_ee.workflows.display.nodes.types import PortDisplayOverrides
+
+from ...nodes.scan_cache_lookup import ScanCacheLookup
+from .._cache import _nd
+from .._uuid_pool import _uuid
+from ._factory import _out
+from ._tables import ATTRIBUTE_IDS, _by_name
+
+
+class ScanCacheLookupDisplay(BaseNodeDisplay[ScanCacheLookup]):
+    label = "Scan Cache Lookup"
+    node_id = _uuid(0xF82988DD_5561_4206_9D30_F644A1B1DFE7)
+    target_handle_id = _uuid(0x17E783B9_C703_418E_905C_FCD13BDAF83C)
+    attribute_ids_by_name = _by_name(ATTRIBUTE_IDS, node_id)
+    output_display = {
+        ScanCacheLookup.Outputs.misses: _out(0x3AA61E1D_DEE7_41FD_B54C_094023F22D04, "misses"),
+        ScanCacheLookup.Outputs.keys: _out(0x950AD4BE_445E_49E7_85BD_A9394ACD9F47, "keys"),
+        ScanCacheLookup.Outputs.cached: _out(0xD5160CE8_FDE1_4068_92F1_C47FCB3D9A93, "cached"),
+    }
+    port_displays = {
+        ScanCacheLookup.Ports.default: PortDisplayOverrides(id=_uuid(0x6CE9AC61_23F0_417B_9CD1_69633CAB2265))
+    }
+    display_data = _nd(2350, 394.11531880245286, 480, 240)
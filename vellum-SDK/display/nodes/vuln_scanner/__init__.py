@@ -0,0 +1,22 @@
+# flake8: noqa: F401, F403
+
+from vellum_ee.workflows.display.nodes import BaseMapNodeDisplay
+from vellum_ee.workflows.display.nodes.types import PortDisplayOverrides
+
+from ....nodes.vuln_scanner import VulnScanner
+from ..._cache import _nd
+from ..._uuid_pool import _uuid
+from .._factory import _out
+from .._tables import NODE_INPUT_IDS, _by_name
+from .nodes import *
+from .workflow import *
+
+
+class VulnScannerDisplay(BaseMapNodeDisplay[VulnScanner]):
+    label = "Vuln Scanner"
+    node_id = _uuid(0x70C7E57B_9824_4F1C_8D2B_F09BC43F036D)
+    target_handle_id = _uuid(0xDAC79D9C_A249_46F8_99F5_5CEB2C0ACDAD)
+    node_input_ids_by_name = _by_name(NODE_INPUT_IDS, node_id)
+    output_display = {VulnScanner.Outputs.json: _out(0x58D0FF70_6791_4B3E_BBE0_6BB512E7BBFE, "json")}
+    port_displays = {VulnScanner.Ports.default: PortDisplayOverrides(id=_uuid(0xDF8CFAD1_7BD2_4A18_84AF_4740D53B1E0C))}
+    display_data = _nd(3500, 394.11531880245286, 554, 539)
@@ -0,0 +1,5 @@
+from .vuln_scanner_shard import VulnScannerShardDisplay
+
+__all__ = [
+    "VulnScannerShardDisplay",
+]
@@ -0,0 +1,27 @@
+from vellum_ee.workflows.display.nodes import BaseInlinePromptNodeDisplay
+from vellum_ee.workflows.display.nodes.types import PortDisplayOverrides
+
+from .....nodes.vuln_scanner.nodes.vuln_scanner_shard import VulnScannerShard
+from ...._cache import _nd
+from ...._uuid_pool import _uuid
+from ..._factory import _out
+from ..._tables import ATTRIBUTE_IDS, NODE_INPUT_IDS, _by_name
+
+
+class VulnScannerShardDisplay(BaseInlinePromptNodeDisplay[VulnScannerShard]):
+    label = "Vuln Scanner Shard"
+    node_id = _uuid(0xAEFD58E7_6713_480F_8486_67F87A3DA4E4)
+    output_id = _uuid(0xE9EF100F_FA6B_44D7_A241_A203189E0CBD)
+    array_output_id = _uuid(0x66DECC68_5DCB_4B61_8A70_1B89E0A4D49A)
+    target_handle_id = _uuid(0x05A2BA1B_ABB7_44C8_96E7_60CE35D6A390)
+    node_input_ids_by_name = _by_name(NODE_INPUT_IDS, node_id)
+    attribute_ids_by_name = _by_name(ATTRIBUTE_IDS, node_id)
+    output_display = {
+        VulnScannerShard.Outputs.text: _out(0xE9EF100F_FA6B_44D7_A241_A203189E0CBD, "text"),
+        VulnScannerShard.Outputs.results: _out(0x66DECC68_5DCB_4B61_8A70_1B89E0A4D49A, "results"),
+        VulnScannerShard.Outputs.json: _out(0xF0A718EC_6C20_4C50_BD5C_19D73EC6757A, "json"),
+    }
+    port_displays = {
+        VulnScannerShard.Ports.default: PortDisplayOverrides(id=_uuid(0xC23764D7_9466_44A0_8201_A1E4269B5339))
+    }
+    display_data = _nd(2302.4195126987356, 394.11531880245286, 554, 539)
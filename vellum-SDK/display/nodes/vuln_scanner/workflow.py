@@ -0,0 +1,42 @@
+from vellum_ee.workflows.display.base import (
+    EdgeDisplay,
+    EntrypointDisplay,
+    WorkflowDisplayData,
+    WorkflowDisplayDataViewport,
+    WorkflowInputsDisplay,
+    WorkflowMetaDisplay,
+    WorkflowOutputDisplay,
+)
+from vellum_ee.workflows.display.workflows import BaseWorkflowDisplay
+
+from ....nodes.vuln_scanner.inputs import Inputs
+from ....nodes.vuln_scanner.nodes.vuln_scanner_shard import VulnScannerShard
+from ....nodes.vuln_scanner.workflow import VulnScannerWorkflow
+from ..._cache import _nd
+from ..._uuid_pool import _uuid
+
+
+class VulnScannerWorkflowDisplay(BaseWorkflowDisplay[VulnScannerWorkflow]):
+    workflow_display = WorkflowMetaDisplay(
+        entrypoint_node_id=_uuid(0x6F77FA46_B941_471F_89E3_1F74423E8CFD),
+        entrypoint_node_source_handle_id=_uuid(0xE40410B0_82D9_48F3_91F9_646E7EA75DC0),
+        entrypoint_node_display=_nd(1560, 330, 124, 48),
+        display_data=WorkflowDisplayData(viewport=WorkflowDisplayDataViewport(x=-1200, y=0, zoom=0.75)),
+    )
+    inputs_display = {
+        Inputs.items: WorkflowInputsDisplay(id=_uuid(0x41A8F1A6_EE78_4588_8E4C_785588F1A538), name="items"),
+        Inputs.item: WorkflowInputsDisplay(id=_uuid(0x8762763C_C686_42D9_8A06_29784C399256), name="item"),
+        Inputs.index: WorkflowInputsDisplay(id=_uuid(0xBE5C2EF8_76C7_4A8F_9E0D_6D5EA403004A), name="index"),
+    }
+    entrypoint_displays = {
+        VulnScannerShard: EntrypointDisplay(
+            id=_uuid(0x6F77FA46_B941_471F_89E3_1F74423E8CFD),
+            edge_display=EdgeDisplay(id=_uuid(0x5F0C6E44_859E_4E49_8C30_7974F2BE1335)),
+        )
+    }
+    edge_displays = {}
+    output_displays = {
+        VulnScannerWorkflow.Outputs.json: WorkflowOutputDisplay(
+            id=_uuid(0x58D0FF70_6791_4B3E_BBE0_6BB512E7BBFE), name="json"
+        ),
+    }
@@ -0,0 +1,24 @@
+# flake8: noqa: F401, F403
+
+from vellum_ee.workflows.display.nodes import BaseMapNodeDisplay
+from vellum_ee.workflows.display.nodes.types import PortDisplayOverrides
+
+from ....nodes.vuln_scanner_deep import VulnScannerDeep
+from ..._cache import _nd
+from ..._uuid_pool import _uuid
+from .._factory import _out
+from .._tables import NODE_INPUT_IDS, _by_name
+from .nodes import *
+from .workflow import *
+
+
+class VulnScannerDeepDisplay(BaseMapNodeDisplay[VulnScannerDeep]):
+    label = "Vuln Scanner Deep"
+    node_id = _uuid(0x74AF239A_5248_4215_81C7_E31DA9989243)
+    target_handle_id = _uuid(0xD5FB3E58_7DAE_4840_9A41_B920C537A9C1)
+    node_input_ids_by_name = _by_name(NODE_INPUT_IDS, node_id)
+    output_display = {VulnScannerDeep.Outputs.json: _out(0x3380AAB8_9FF5_469B_84A3_FA7C312CE3F8, "json")}
+    port_displays = {
+        VulnScannerDeep.Ports.default: PortDisplayOverrides(id=_uuid(0x8ACBE7E5_66A9_4B2C_8D0C_A77C06CF0D4E))
+    }
+    display_data = _nd(4700, 394.11531880245286, 554, 539)
@@ -0,0 +1,5 @@
+from .vuln_scanner_deep_batch import VulnScannerDeepBatchDisplay
+
+__all__ = [
+    "VulnScannerDeepBatchDisplay",
+]
@@ -0,0 +1,27 @@
+from vellum_ee.workflows.display.nodes import BaseInlinePromptNodeDisplay
+from vellum_ee.workflows.display.nodes.types import PortDisplayOverrides
+
+from .....nodes.vuln_scanner_deep.nodes.vuln_scanner_deep_batch import VulnScannerDeepBatch
+from ...._cache import _nd
+from ...._uuid_pool import _uuid
+from ..._factory import _out
+from ..._tables import ATTRIBUTE_IDS, NODE_INPUT_IDS, _by_name
+
+
+class VulnScannerDeepBatchDisplay(BaseInlinePromptNodeDisplay[VulnScannerDeepBatch]):
+    label = "Vuln Scanner Deep Batch"
+    node_id = _uuid(0x47BDE388_D9B0_4E96_B6C5_AA0ED312FC8A)
+    output_id = _uuid(0x40DDA408_CCBE_4EF5_A689_0147E2DF3519)
+    array_output_id = _uuid(0x4519E249_481A_439F_B8F4_6A63BBEBF43A)
+    target_handle_id = _uuid(0x35EC1DF4_5917_49A5_90E5_A014590FA8A7)
+    node_input_ids_by_name = _by_name(NODE_INPUT_IDS, node_id)
+    attribute_ids_by_name = _by_name(ATTRIBUTE_IDS, node_id)
+    output_display = {
+        VulnScannerDeepBatch.Outputs.text: _out(0x40DDA408_CCBE_4EF5_A689_0147E2DF3519, "text"),
+        VulnScannerDeepBatch.Outputs.results: _out(0x4519E249_481A_439F_B8F4_6A63BBEBF43A, "results"),
+        VulnScannerDeepBatch.Outputs.json: _out(0x3B351610_33DA_4DF0_BA44_C6CF91BD8FAA, "json"),
+    }
+    port_displays = {
+        VulnScannerDeepBatch.Ports.default: PortDisplayOverrides(id=_uuid(0xCE91292F_93B9_4271_995A_CE070505F6F8))
+    }
+    display_data = _nd(2302.4195126987356, 394.11531880245286, 554, 539)
@@ -0,0 +1,42 @@
+from vellum_ee.workflows.display.base import (
+    EdgeDisplay,
+    EntrypointDisplay,
+    WorkflowDisplayData,
+    WorkflowDisplayDataViewport,
+    WorkflowInputsDisplay,
+    WorkflowMetaDisplay,
+    WorkflowOutputDisplay,
+)
+from vellum_ee.workflows.display.workflows import BaseWorkflowDisplay
+
+from ....nodes.vuln_scanner_deep.inputs import Inputs
+from ....nodes.vuln_scanner_deep.nodes.vuln_scanner_deep_batch import VulnScannerDeepBatch
+from ....nodes.vuln_scanner_deep.workflow import VulnScannerDeepWorkflow
+from ..._cache import _nd
+from ..._uuid_pool import _uuid
+
+
+class VulnScannerDeepWorkflowDisplay(BaseWorkflowDisplay[VulnScannerDeepWorkflow]):
+    workflow_display = WorkflowMetaDisplay(
+        entrypoint_node_id=_uuid(0xDF3BBD77_7074_4100_834C_C280550823AA),
+        entrypoint_node_source_handle_id=_uuid(0x2A9146D3_BB3B_4C49_9802_C695D0D681AE),
+        entrypoint_node_display=_nd(1560, 330, 124, 48),
+        display_data=WorkflowDisplayData(viewport=WorkflowDisplayDataViewport(x=-1200, y=0, zoom=0.75)),
+    )
+    inputs_display = {
+        Inputs.items: WorkflowInputsDisplay(id=_uuid(0x9EB56813_EC49_48C4_A1F3_2C6E8F77D7EE), name="items"),
+        Inputs.item: WorkflowInputsDisplay(id=_uuid(0xC84CFF2E_C5BE_4A7A_A35D_DB43DB2C4011), name="item"),
+        Inputs.index: WorkflowInputsDisplay(id=_uuid(0x96AD02E9_7859_4C1F_BED6_7D3043E0D904), name="index"),
+    }
+    entrypoint_displays = {
+        VulnScannerDeepBatch: EntrypointDisplay(
+            id=_uuid(0xDF3BBD77_7074_4100_834C_C280550823AA),
+            edge_display=EdgeDisplay(id=_uuid(0x7419C914_AC6D_4AE2_AC42_360F267F2282)),
+        )
+    }
+    edge_displays = {}
+    output_displays = {
+        VulnScannerDeepWorkflow.Outputs.json: WorkflowOutputDisplay(
+            id=_uuid(0x3380AAB8_9FF5_469B_84A3_FA7C312CE3F8), name="json"
+        ),
+    }
@@ -0,0 +1,25 @@
+from vellum_ee.workflows.display.nodes import BaseNodeDisplay
+from vellum_ee.workflows.display.nodes.types import PortDisplayOverrides
+
+from ...nodes.vuln_scanner_merge import VulnScannerMerge
+from .._cache import _nd
+from .._uuid_pool import _uuid
+from ._factory import _out
+from ._tables import ATTRIBUTE_IDS, _by_name
+
+
+class VulnScannerMergeDisplay(BaseNodeDisplay[VulnScannerMerge]):
+    label = "Vuln Scanner Merge"
+    node_id = _uuid(0x7A6D4520_7EF3_4858_9A5A_4085F04A418A)
+    target_handle_id = _uuid(0xD9C4D647_CB8A_42D9_910B_98090C07E47F)
+    attribute_ids_by_name = _by_name(ATTRIBUTE_IDS, node_id)
+    output_display = {
+        VulnScannerMerge.Outputs.json: _out(0xE1F56615_4ADC_4F2F_ACF8_5DF510EADAF4, "json"),
+        VulnScannerMerge.Outputs.escalations: _out(0xAA48D951_C812_41EC_8572_BD4197458984, "escalations"),
+        VulnScannerMerge.Outputs.deep_keys: _out(0x93523678_B42E_4E40_9E53_9B2C28F58BE5, "deep_keys"),
+        VulnScannerMerge.Outputs.cached_verdicts: _out(0x57FA8A5A_E345_4465_A688_1C3B3C502717, "cached_verdicts"),
+    }
+    port_displays = {
+        VulnScannerMerge.Ports.default: PortDisplayOverrides(id=_uuid(0xEF2C4B0D_8D9C_4158_AB6A_5EAE76273587))
+    }
+    display_data = _nd(4100, 394.11531880245286, 480, 240)
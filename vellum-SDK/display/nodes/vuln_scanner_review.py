@@ -0,0 +1,23 @@
+from vellum_ee.workflows.display.nodes import BaseNodeDisplay
+from vellum_ee.workflows.display.nodes.types import PortDisplayOverrides
+
+from ...nodes.vuln_scanner_review import VulnScannerReview
+from .._cache import _nd
+from .._uuid_pool import _uuid
+from ._factory import _out
+from ._tables import ATTRIBUTE_IDS, _by_name
+
+
+class VulnScannerReviewDisplay(BaseNodeDisplay[VulnScannerReview]):
+    label = "Vuln Scanner Review"
+    node_id = _uuid(0x29384CDC_7300_4FE4_96AC_2CDAE1ED005E)
+    target_handle_id = _uuid(0x6678115D_0577_46FB_BA50_44B207281283)
+    attribute_ids_by_name = _by_name(ATTRIBUTE_IDS, node_id)
+    output_display = {
+        VulnScannerReview.Outputs.json: _out(0x8E33EFF5_F0A2_490C_9F22_0E6C849FAC8C, "json"),
+        VulnScannerReview.Outputs.high_risk_files: _out(0x3068ECC6_A40B_4584_B9E0_2F4D84843FF2, "high_risk_files"),
+    }
+    port_displays = {
+        VulnScannerReview.Ports.default: PortDisplayOverrides(id=_uuid(0xCFCEA348_C28D_436E_9A60_563FA2FDC643))
+    }
+    display_data = _nd(5300, 394.11531880245286, 480, 240)
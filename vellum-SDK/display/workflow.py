@@ -1,5 +1,3 @@
-from uuid import UUID
-
 from vellum_ee.workflows.display.base import (
     EdgeDisplay,
     EntrypointDisplay,
@@ -9,49 +7,68 @@ from vellum_ee.workflows.display.base import (
     WorkflowMetaDisplay,
     WorkflowOutputDisplay,
 )
-from vellum_ee.workflows.display.editor import NodeDisplayData, NodeDisplayPosition
 from vellum_ee.workflows.display.workflows import BaseWorkflowDisplay
 
 from ..inputs import Inputs
 from ..nodes.file_list import FileList
+from ..nodes.file_list_sharder import FileListSharder
 from ..nodes.patcher import Patcher
+from ..nodes.patcher_merge import PatcherMerge
 from ..nodes.results import Results
+from ..nodes.scan_cache_lookup import ScanCacheLookup
 from ..nodes.scanned_files import ScannedFiles
 from ..nodes.vuln_scanner import VulnScanner
+from ..nodes.vuln_scanner_deep import VulnScannerDeep
+from ..nodes.vuln_scanner_merge import VulnScannerMerge
+from ..nodes.vuln_scanner_review import VulnScannerReview
 from ..workflow import Workflow
+from ._cache import _nd
+from ._uuid_pool import _uuid
+from .nodes.results import ResultsDisplay
+from .nodes.scanned_files import ScannedFilesDisplay
 
 
 class WorkflowDisplay(BaseWorkflowDisplay[Workflow]):
     workflow_display = WorkflowMetaDisplay(
-        entrypoint_node_id=UUID("ee97bed4-2bdf-4d21-aff8-643878e1ec79"),
-        entrypoint_node_source_handle_id=UUID("403d42b2-6d86-4f4c-ab6c-a0b56150394d"),
-        entrypoint_node_display=NodeDisplayData(position=NodeDisplayPosition(x=1560, y=330), width=124, height=48),
+        entrypoint_node_id=_uuid(0xEE97BED4_2BDF_4D21_AFF8_643878E1EC79),
+        entrypoint_node_source_handle_id=_uuid(0x403D42B2_6D86_4F4C_AB6C_A0B56150394D),
+        entrypoint_node_display=_nd(1560, 330, 124, 48),
         display_data=WorkflowDisplayData(
             viewport=WorkflowDisplayDataViewport(x=-614.203782722883, y=30.678680396614283, zoom=0.42929729661723276)
         ),
     )
     inputs_display = {
         Inputs.fileTree: WorkflowInputsDisplay(
-            id=UUID("7bec3bd4-c59d-43f1-acbe-5369d986913f"), name="fileTree", color="navy"
+            id=_uuid(0x7BEC3BD4_C59D_43F1_ACBE_5369D986913F), name="fileTree", color="navy"
         )
     }
     entrypoint_displays = {
         FileList: EntrypointDisplay(
-            id=UUID("ee97bed4-2bdf-4d21-aff8-643878e1ec79"),
-            edge_display=EdgeDisplay(id=UUID("26f28651-139c-48c7-89d3-fb80322e8152")),
+            id=_uuid(0xEE97BED4_2BDF_4D21_AFF8_643878E1EC79),
+            edge_display=EdgeDisplay(id=_uuid(0x26F28651_139C_48C7_89D3_FB80322E8152)),
         )
     }
     edge_displays = {
-        (FileList.Ports.default, VulnScanner): EdgeDisplay(id=UUID("28584e95-9acd-481a-8179-b10042079f99")),
-        (VulnScanner.Ports.default, Patcher): EdgeDisplay(id=UUID("3d10ed54-84a4-4be8-afef-cdc698b1fde6")),
-        (VulnScanner.Ports.default, ScannedFiles): EdgeDisplay(id=UUID("f2a6ef44-142f-4973-abf9-1e3c45e2f06b")),
-        (Patcher.Ports.default, Results): EdgeDisplay(id=UUID("4ce4c8e3-b914-4946-af5b-523ce3f1dbe4")),
+        (FileList.Ports.default, ScanCacheLookup): EdgeDisplay(id=_uuid(0x39EB5628_0A7E_42BC_B107_00CDAF18C4AC)),
+        (ScanCacheLookup.Ports.default, FileListSharder): EdgeDisplay(id=_uuid(0xE454A6E3_1AAD_4402_9CCE_31A5D4D5C06F)),
+        (FileListSharder.Ports.default, VulnScanner): EdgeDisplay(id=_uuid(0x51E17E81_E3B7_4709_82D8_8AAEB7B1D384)),
+        (VulnScanner.Ports.default, VulnScannerMerge): EdgeDisplay(id=_uuid(0x98D827B0_2655_4AAD_AF7C_2138AAB70927)),
+        (VulnScannerMerge.Ports.default, VulnScannerDeep): EdgeDisplay(
+            id=_uuid(0xD920A654_6617_4970_BAFD_87647AF95927)
+        ),
+        (VulnScannerDeep.Ports.default, VulnScannerReview): EdgeDisplay(
+            id=_uuid(0xC2A33614_F413_4732_A2D4_2F2DB61EB64B)
+        ),
+        (VulnScannerReview.Ports.default, Patcher): EdgeDisplay(id=_uuid(0x3D10ED54_84A4_4BE8_AFEF_CDC698B1FDE6)),
+        (VulnScannerReview.Ports.default, ScannedFiles): EdgeDisplay(id=_uuid(0xF2A6EF44_142F_4973_ABF9_1E3C45E2F06B)),
+        (Patcher.Ports.default, PatcherMerge): EdgeDisplay(id=_uuid(0xC2E56E81_5C3C_442A_850A_135CAFDEF978)),
+        (PatcherMerge.Ports.default, Results): EdgeDisplay(id=_uuid(0x4CE4C8E3_B914_4946_AF5B_523CE3F1DBE4)),
     }
     output_displays = {
         Workflow.Outputs.scanned_files: WorkflowOutputDisplay(
-            id=UUID("b688c094-5fc8-4c07-9877-ec29fbb57585"), name="scanned-files"
+            id=ScannedFilesDisplay.output_display[ScannedFiles.Outputs.value].id, name="scanned-files"
         ),
         Workflow.Outputs.results: WorkflowOutputDisplay(
-            id=UUID("e1d9a969-4041-46e6-8cb2-11f0726f2a14"), name="results"
+            id=ResultsDisplay.output_display[Results.Outputs.value].id, name="results"
         ),
     }
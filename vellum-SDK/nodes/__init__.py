@@ -1,13 +1,25 @@
 from .file_list import FileList
+from .file_list_sharder import FileListSharder
 from .patcher import Patcher
+from .patcher_merge import PatcherMerge
 from .results import Results
+from .scan_cache_lookup import ScanCacheLookup
 from .scanned_files import ScannedFiles
 from .vuln_scanner import VulnScanner
+from .vuln_scanner_deep import VulnScannerDeep
+from .vuln_scanner_merge import VulnScannerMerge
+from .vuln_scanner_review import VulnScannerReview
 
 __all__ = [
     "FileList",
+    "FileListSharder",
     "Patcher",
+    "PatcherMerge",
     "Results",
+    "ScanCacheLookup",
     "ScannedFiles",
     "VulnScanner",
+    "VulnScannerDeep",
+    "VulnScannerMerge",
+    "VulnScannerReview",
 ]
@@ -1,34 +1,80 @@
-from vellum.workflows.nodes.displayable import TemplatingNode
-from vellum.workflows.state import BaseState
-from vellum.workflows.types.core import Json
+import hashlib
+from typing import Any, Dict, List
+
+from vellum.workflows.nodes.bases import BaseNode
 
 from ..inputs import Inputs
+from .prefilter import (
+    BINARY_REASON,
+    BINARY_SNIFF_CHARS,
+    IGNORE_EXTS,
+    IGNORE_REASON,
+    LOW_LANGUAGES,
+    LOW_RISK_REASON,
+    OBVIOUS_LOW_EXTS,
+    matching_ext,
+)
+
+
+class FileList(BaseNode):
+    file_tree = Inputs.fileTree
+
+    class Outputs(BaseNode.Outputs):
+        result: List[Dict[str, Any]]
+        # Representative path -> the other files with byte-identical content. Only the
+        # representative is sent to the scanner; VulnScannerMerge copies its classification back.
+        duplicates: Dict[str, List[Dict[str, str]]]
+        # Files classified by extension alone (see prefilter.py); they never reach the scanner.
+        ignored: List[Dict[str, str]]
+        low_risk: List[Dict[str, str]]
+
+    def run(self) -> Outputs:
+        data = (self.file_tree or {}).get("data") or {}
+        files = data.get("files") or []
+
+        result: List[Dict[str, Any]] = []
+        duplicates: Dict[str, List[Dict[str, str]]] = {}
+        ignored: List[Dict[str, str]] = []
+        low_risk: List[Dict[str, str]] = []
+        representatives: Dict[bytes, str] = {}
+        for file in files:
+            name = file["name"]
+            path = file["path"]
+            if matching_ext(name, IGNORE_EXTS):
+                ignored.append({"name": name, "path": path, "ignore_reason": IGNORE_REASON})
+                continue
+
+            entry = {"name": name, "path": path, "parent_folder": _parent_folder(path)}
+            low_ext = matching_ext(name, OBVIOUS_LOW_EXTS)
+            if low_ext:
+                low_risk.append(
+                    {**entry, "file_type": "OTHER", "language": LOW_LANGUAGES[low_ext], "risk_reason": LOW_RISK_REASON}
+                )
+                continue
+
+            content = file["content"]
+            if content and "\x00" in content[:BINARY_SNIFF_CHARS]:
+                ignored.append({"name": name, "path": path, "ignore_reason": BINARY_REASON})
+                continue
+
+            # Empty content means the file wasn't fetched (binary, skipped or failed), not that the
+            # files are the same, so those are never grouped.
+            if content:
+                digest = hashlib.sha256(content.encode("utf-8")).digest()
+                representative = representatives.setdefault(digest, path)
+                if representative != path:
+                    duplicates.setdefault(representative, []).append(entry)
+                    continue
+
+            entry["content"] = content
+            # GitHub's byte size from the tree listing; still known when the content wasn't fetched.
+            entry["size"] = file.get("size")
+            result.append(entry)
+
+        return self.Outputs(result=result, duplicates=duplicates, ignored=ignored, low_risk=low_risk)
 
 
-class FileList(TemplatingNode[BaseState, Json]):
-    template = """\
-{% if fileTree.data and fileTree.data.files %}
-[
-{% for file in fileTree.data.files %}
-  {% set path_parts = file.path.split(\'/\') %}
-  {% set parent_folder = \'\' %}
-  {% if path_parts|length > 1 %}
-    {% set parent_folder = path_parts[:-1]|join(\'/\') %}
-  {% else %}
-    {% set parent_folder = \'Root\' %}
-  {% endif %}
-  {
-      \"name\": {{ file.name | tojson }},
-      \"path\": {{ file.path | tojson }},
-      \"parent_folder\": {{ parent_folder | tojson }},
-      \"content\": {{ file.content | tojson }}
-  }{% if not loop.last %},{% endif %}
-{% endfor %}
-]
-{% else %}
-[]
-{% endif %}\
-"""
-    inputs = {
-        "fileTree": Inputs.fileTree,
-    }
+def _parent_folder(path: str) -> str:
+    # rpartition scans the path once and allocates no intermediate list.
+    parent, separator, _ = path.rpartition("/")
+    return parent if separator else "Root"
@@ -0,0 +1,58 @@
+from typing import Any, Dict, List
+
+from vellum.workflows.nodes.bases import BaseNode
+
+from .scan_cache_lookup import ScanCacheLookup
+
+# Files per VulnScanner shard. Small enough that each prompt stays short and the shards can be
+# decoded concurrently, large enough that the per-request preamble is amortized.
+SHARD_SIZE = 25
+
+# Classification only needs a sample of each file: imports, shebangs and framework tells sit at the
+# top, exports and entry points at the bottom. Longer files are cut to head + tail.
+SAMPLE_HEAD_CHARS = 8192
+SAMPLE_TAIL_CHARS = 2048
+TRUNCATION_MARKER = "\n...[TRUNCATED]...\n"
+
+
+class FileListSharder(BaseNode):
+    files = ScanCacheLookup.Outputs.misses
+    shard_size = SHARD_SIZE
+
+    class Outputs(BaseNode.Outputs):
+        shards: List[str]
+
+    def run(self) -> Outputs:
+        files = self.files
+        return self.Outputs(
+            shards=[
+                _format_shard(files[start : start + self.shard_size]) for start in range(0, len(files), self.shard_size)
+            ]
+        )
+
+
+def _format_shard(files: List[Dict[str, Any]]) -> str:
+    # One "=== path (size)" header per file followed by its raw content, instead of a JSON array:
+    # no repeated keys, and source code isn't re-escaped (every newline and quote inside a JSON
+    # string costs extra tokens).
+    return "\n".join(f"=== {file['path']} ({_describe_size(file)})\n{_sample(file['content'] or '')}" for file in files)
+
+
+def _describe_size(file: Dict[str, Any]) -> str:
+    # The size comes from the GitHub listing, so files whose content wasn't fetched (skipped by
+    # extension or a failed request) don't look like empty files to the model.
+    content = file["content"] or ""
+    size = file.get("size")
+    if size is None:
+        size = len(content.encode("utf-8"))
+    return f"{size} bytes, content not fetched" if size and not content else f"{size} bytes"
+
+
+def _sample(content: str) -> str:
+    return truncate_middle(content, SAMPLE_HEAD_CHARS, SAMPLE_TAIL_CHARS)
+
+
+def truncate_middle(content: str, head_chars: int, tail_chars: int) -> str:
+    if len(content) <= head_chars + tail_chars:
+        return content
+    return content[:head_chars] + TRUNCATION_MARKER + content[-tail_chars:]
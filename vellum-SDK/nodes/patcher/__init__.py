@@ -0,0 +1,12 @@
+from vellum.workflows.nodes.displayable import MapNode
+
+from ..vuln_scanner_review import VulnScannerReview
+from .workflow import PatcherWorkflow
+
+
+class Patcher(MapNode):
+    # One fix-generation call per high-risk file, issued concurrently, instead of one call that
+    # has to write every fix before the workflow can finish.
+    items = VulnScannerReview.Outputs.high_risk_files
+    subworkflow = PatcherWorkflow
+    max_concurrency = 4
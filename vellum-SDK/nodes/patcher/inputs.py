@@ -0,0 +1,9 @@
+from typing import Any, Dict, List
+
+from vellum.workflows.inputs import BaseInputs
+
+
+class Inputs(BaseInputs):
+    items: List[Dict[str, Any]]
+    item: Dict[str, Any]
+    index: int
@@ -0,0 +1,5 @@
+from .file_patcher import FilePatcher
+
+__all__ = [
+    "FilePatcher",
+]
@@ -0,0 +1,12 @@
+from vellum.workflows import BaseWorkflow
+from vellum.workflows.state import BaseState
+
+from .inputs import Inputs
+from .nodes.file_patcher import FilePatcher
+
+
+class PatcherWorkflow(BaseWorkflow[Inputs, BaseState]):
+    graph = FilePatcher
+
+    class Outputs(BaseWorkflow.Outputs):
+        json = FilePatcher.Outputs.json
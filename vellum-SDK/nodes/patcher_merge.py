@@ -0,0 +1,62 @@
+from typing import Any, Dict, List
+
+from vellum.workflows.nodes.bases import BaseNode
+
+from .patcher import Patcher
+
+
+class PatcherMerge(BaseNode):
+    fix_results = Patcher.Outputs.json
+
+    class Outputs(BaseNode.Outputs):
+        json: Dict[str, Any]
+
+    def run(self) -> Outputs:
+        fixes: List[Dict[str, Any]] = []
+        priority_order: List[str] = []
+        estimated_fix_times: List[str] = []
+        prerequisites: List[str] = []
+        rollback_plans: List[str] = []
+        deployment_steps: List[Dict[str, Any]] = []
+        monitoring_recommendations: List[str] = []
+        for fix_result in self.fix_results:
+            if not fix_result:
+                continue
+            fixes.extend(fix_result.get("fixes") or [])
+
+            summary = fix_result.get("fix_summary") or {}
+            priority_order.extend(summary.get("priority_order") or [])
+            if summary.get("estimated_fix_time"):
+                estimated_fix_times.append(summary["estimated_fix_time"])
+
+            guide = fix_result.get("implementation_guide") or {}
+            prerequisites.extend(guide.get("prerequisites") or [])
+            if guide.get("rollback_plan"):
+                rollback_plans.append(guide["rollback_plan"])
+            deployment_steps.extend(guide.get("deployment_steps") or [])
+            monitoring_recommendations.extend(guide.get("monitoring_recommendations") or [])
+
+        confidences = [fix.get("fix_confidence") for fix in fixes]
+        return self.Outputs(
+            json={
+                "fixes": fixes,
+                "fix_summary": {
+                    "total_fixes": len(fixes),
+                    "files_modified": len({fix.get("file_path") for fix in fixes}),
+                    "priority_order": list(dict.fromkeys(priority_order)),
+                    "estimated_fix_time": " + ".join(estimated_fix_times),
+                    "high_confidence_fixes": confidences.count("HIGH"),
+                    "medium_confidence_fixes": confidences.count("MEDIUM"),
+                    "low_confidence_fixes": confidences.count("LOW"),
+                    "breaking_changes_count": sum(1 for fix in fixes if fix.get("breaking_changes")),
+                },
+                "implementation_guide": {
+                    "prerequisites": list(dict.fromkeys(prerequisites)),
+                    "rollback_plan": "\n".join(rollback_plans),
+                    "deployment_steps": [
+                        {**step, "step": number} for number, step in enumerate(deployment_steps, start=1)
+                    ],
+                    "monitoring_recommendations": list(dict.fromkeys(monitoring_recommendations)),
+                },
+            }
+        )
@@ -0,0 +1,91 @@
+from typing import Optional
+
+# Suffixes the scanner prompt would classify as IGNORE anyway: images, media, fonts, archives,
+# compiled binaries and generated assets. Matched case-insensitively against the file name.
+IGNORE_EXTS = frozenset(
+    {
+        # Images
+        ".png",
+        ".jpg",
+        ".jpeg",
+        ".gif",
+        ".svg",
+        ".ico",
+        ".webp",
+        ".bmp",
+        ".tiff",
+        # Media
+        ".mp3",
+        ".mp4",
+        ".wav",
+        ".mov",
+        ".webm",
+        # Fonts
+        ".woff",
+        ".woff2",
+        ".ttf",
+        ".otf",
+        ".eot",
+        # Office documents
+        ".pdf",
+        ".doc",
+        ".docx",
+        ".ppt",
+        ".pptx",
+        ".xls",
+        ".xlsx",
+        # Archives
+        ".zip",
+        ".tar",
+        ".gz",
+        ".tgz",
+        ".rar",
+        ".7z",
+        ".jar",
+        # Compiled binaries
+        ".exe",
+        ".dll",
+        ".so",
+        ".dylib",
+        ".class",
+        ".pyc",
+        ".o",
+        ".wasm",
+        # Generated assets and lockfiles
+        ".min.js",
+        ".min.css",
+        ".map",
+        ".lock",
+    }
+)
+
+# Plain-text documentation that can't execute anything and is classified LOW without a model call,
+# mapped to the language reported for it. .txt is deliberately absent: requirements.txt and
+# CMakeLists.txt are a dependency manifest and a build script, and need the scanner.
+LOW_LANGUAGES = {
+    ".md": "Markdown",
+    ".markdown": "Markdown",
+    ".rst": "reStructuredText",
+    ".adoc": "AsciiDoc",
+}
+OBVIOUS_LOW_EXTS = frozenset(LOW_LANGUAGES)
+
+IGNORE_REASON = "extension denylist"
+BINARY_REASON = "binary content"
+
+# A NUL in the first bytes marks content that was decoded from a binary file the denylist missed.
+BINARY_SNIFF_CHARS = 512
+LOW_RISK_REASON = "Plain-text documentation; contains no executable code"
+
+
+def matching_ext(name: str, exts: frozenset) -> Optional[str]:
+    # Every entry starts with ".", so only the suffixes beginning at a dot can match: look those up
+    # in the set (longest first) instead of running endswith against each extension.
+    lowered = name.lower()
+    dot = lowered.find(".")
+    while dot != -1:
+        suffix = lowered[dot:]
+        if suffix in exts:
+            return suffix
+        dot = lowered.find(".", dot + 1)
+    return None
@@ -3,9 +3,9 @@ from typing import Any
 from vellum.workflows.nodes.displayable import FinalOutputNode
 from vellum.workflows.state import BaseState
 
-from .patcher import Patcher
+from .patcher_merge import PatcherMerge
 
 
 class Results(FinalOutputNode[BaseState, Any]):
     class Outputs(FinalOutputNode.Outputs):
-        value = Patcher.Outputs.json
+        value = PatcherMerge.Outputs.json
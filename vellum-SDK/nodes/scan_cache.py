@@ -0,0 +1,71 @@
+import gzip
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Per-file scanner records and deep-review verdicts, keyed by the file's path and content hash plus a
+# salt of the producing stage's model, prompt and schema, so an unchanged file is never classified or
+# reviewed twice and a prompt change misses. Opt-in: the hosted deployment has no durable disk, so the cache is only used where
+# VULN_SCANNER_CACHE_DIR points at one (local or self-hosted runs). Entries expire after
+# TTL_SECONDS so a bad classification doesn't stick, and prune() caps the entry count.
+# Best effort: an unreadable or unwritable cache is a miss.
+_CACHE_DIR = os.environ.get("VULN_SCANNER_CACHE_DIR")
+CACHE_DIR = Path(_CACHE_DIR) if _CACHE_DIR else None
+TTL_SECONDS = 7 * 24 * 60 * 60
+MAX_ENTRIES = 50_000
+
+_SUFFIX = ".json.gz"
+
+
+def file_key(salt: str, path: str, content: str, size: Optional[int] = None) -> str:
+    # The size is part of the scanner's input (it's all it sees of a file whose content wasn't fetched).
+    content_hash = hashlib.sha256((content or "").encode("utf-8")).hexdigest()
+    return hashlib.sha256(f"{salt}\0{path}\0{size}\0{content_hash}".encode("utf-8")).hexdigest()
+
+
+def load(key: str) -> Optional[Dict[str, Any]]:
+    if CACHE_DIR is None:
+        return None
+    path = CACHE_DIR / f"{key}{_SUFFIX}"
+    try:
+        if time.time() - path.stat().st_mtime > TTL_SECONDS:
+            return None
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+
+def store(key: str, entry: Dict[str, Any]) -> None:
+    if CACHE_DIR is None:
+        return
+    path = CACHE_DIR / f"{key}{_SUFFIX}"
+    partial = path.with_name(f"{key}.{os.getpid()}.tmp")
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with gzip.open(partial, "wt", encoding="utf-8") as file:
+            json.dump(entry, file)
+        os.replace(partial, path)
+    except OSError:
+        pass
+
+
+def prune() -> None:
+    """Deletes expired entries, then the oldest ones beyond MAX_ENTRIES."""
+    if CACHE_DIR is None:
+        return
+    try:
+        entries = [(entry.stat().st_mtime, entry.path) for entry in os.scandir(CACHE_DIR) if entry.is_file()]
+    except OSError:
+        return
+    entries.sort(reverse=True)
+    cutoff = time.time() - TTL_SECONDS
+    for index, (mtime, path) in enumerate(entries):
+        if index >= MAX_ENTRIES or mtime < cutoff:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
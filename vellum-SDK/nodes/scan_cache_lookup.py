@@ -0,0 +1,36 @@
+from typing import Any, Dict, List
+
+from vellum.workflows.nodes.bases import BaseNode
+
+from . import scan_cache
+from .file_list import FileList
+from .scanner_prompt import SCANNER_CACHE_SALT
+
+SCANNED_GROUPS = ("high_risk_files", "medium_risk_files", "low_risk_files", "ignored_files")
+
+
+class ScanCacheLookup(BaseNode):
+    files = FileList.Outputs.result
+
+    class Outputs(BaseNode.Outputs):
+        # Files without a cached record; only these are sharded and scanned.
+        misses: List[Dict[str, Any]]
+        # Path -> cache key for every miss, so VulnScannerMerge can store what the scanner returns.
+        keys: Dict[str, str]
+        # Cached records, in the scanner's output shape.
+        cached: Dict[str, List[Dict[str, Any]]]
+
+    def run(self) -> Outputs:
+        misses: List[Dict[str, Any]] = []
+        keys: Dict[str, str] = {}
+        cached: Dict[str, List[Dict[str, Any]]] = {group: [] for group in SCANNED_GROUPS}
+        for file in self.files:
+            key = scan_cache.file_key(SCANNER_CACHE_SALT, file["path"], file["content"], file.get("size"))
+            entry = scan_cache.load(key)
+            group = cached.get(entry.get("group")) if isinstance(entry, dict) else None
+            if group is None:
+                misses.append(file)
+                keys[file["path"]] = key
+            else:
+                group.append(entry["record"])
+        return self.Outputs(misses=misses, keys=keys, cached=cached)
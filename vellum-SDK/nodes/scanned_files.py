@@ -3,9 +3,9 @@ from typing import Any
 from vellum.workflows.nodes.displayable import FinalOutputNode
 from vellum.workflows.state import BaseState
 
-from .vuln_scanner import VulnScanner
+from .vuln_scanner_review import VulnScannerReview
 
 
 class ScannedFiles(FinalOutputNode[BaseState, Any]):
     class Outputs(FinalOutputNode.Outputs):
-        value = VulnScanner.Outputs.json
+        value = VulnScannerReview.Outputs.json
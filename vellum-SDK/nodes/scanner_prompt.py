@@ -0,0 +1,266 @@
+import hashlib
+import json
+from typing import Any
+
+# The bulk scanner's and the deep review's prompts, schemas and models, kept free of node imports so
+# that ScanCacheLookup and VulnScannerMerge (upstream of the prompt maps) can derive their cache salts.
+
+# risk_reason is a closed set of codes so the model never free-writes an explanation per file;
+# VulnScannerMerge expands each code to its description (plus the optional short detail).
+RISK_REASON_CODES = {
+    "SQL_INJECTION_SINK": "Builds SQL queries from untrusted input",
+    "COMMAND_INJECTION": "Runs shell commands built from untrusted input",
+    "CODE_EVAL": "Evaluates dynamically constructed code",
+    "UNSAFE_DESERIALIZE": "Deserializes untrusted data",
+    "PATH_TRAVERSAL": "Resolves file paths from untrusted input",
+    "FILE_UPLOAD": "Accepts and stores uploaded files",
+    "XSS_SINK": "Renders untrusted input into HTML",
+    "TEMPLATE_INJECTION": "Renders user-controlled templates",
+    "SSRF": "Makes outbound requests to user-controlled URLs",
+    "OPEN_REDIRECT": "Redirects to user-controlled URLs",
+    "HARDCODED_SECRET": "Contains hardcoded secrets or credentials",
+    "SECRETS_CONFIG": "Configuration that holds secrets or connection strings",
+    "WEAK_CRYPTO": "Uses weak or misconfigured cryptography",
+    "INSECURE_RANDOM": "Uses non-cryptographic randomness for security values",
+    "AUTHENTICATION": "Implements login, password or token handling",
+    "AUTHORIZATION": "Implements authorization or role checks",
+    "SESSION_MANAGEMENT": "Creates or validates user sessions",
+    "CSRF": "Handles state-changing requests without visible CSRF protection",
+    "CORS_CONFIG": "Configures cross-origin access",
+    "SECURITY_MISCONFIG": "Security-relevant configuration (debug mode, headers, permissions)",
+    "ROUTE_HANDLER": "Handles HTTP requests from untrusted clients",
+    "DATABASE_ACCESS": "Reads or writes the database",
+    "DATABASE_SCHEMA": "Database schema, migration or seed data",
+    "INPUT_VALIDATION": "Parses or validates user input",
+    "DEPENDENCY_MANIFEST": "Declares third-party dependencies",
+    "INFRASTRUCTURE": "Build, deployment or container configuration",
+    "CLIENT_LOGIC": "Client-side logic with limited security impact",
+    "STATIC_CONTENT": "Static content with no executable behavior",
+    "TEST_CODE": "Test code that does not ship",
+    "NO_SECURITY_IMPACT": "Ordinary application or utility code with no security-relevant behavior",
+    "OTHER": "Other security-relevant behavior",
+}
+
+# The prompt is laid out for provider-side prefix caching (OpenAI caches automatically; no
+# cache id is needed). Everything before the fileList variable -- the preamble below and the
+# response schema -- must be byte-identical on every call, and the variable block must stay last:
+#   * don't interpolate per-run values (timestamps, counts, repo names) into SCANNER_PREAMBLE;
+#   * don't reorder the blocks or put anything after VariablePromptBlock("fileList");
+#   * edit SCANNER_PREAMBLE / _SCANNER_FULL_SCHEMA only deliberately, since any change invalidates the
+#     cached prefix for every in-flight shard.
+SCANNER_PREAMBLE = (
+    """\
+You are a security-focused file analyzer. Given a batch of files from a repository, classify each file by: 
+ 
+1. **Security Risk Level**: HIGH, MEDIUM, LOW, IGNORE 
+2. **File Type** (respond with the single-letter code): W = WEB_APP, A = API, C = CONFIG, D = DATABASE, F = FRONTEND, O = OTHER 
+3. **Language**: Python, JavaScript, PHP, SQL, etc. 
+4. **Risk Reason** (respond with one code; use risk_reason_detail only for a short clarification; use NO_SECURITY_IMPACT, not OTHER, for LOW files with nothing security-relevant): \
+"""
+    + ", ".join(RISK_REASON_CODES)
+    + """
+ 
+Focus on files that typically contain vulnerabilities: 
+- Web application files (.py, .js, .php) 
+- Configuration files (.env, .yml, .json) 
+- Database files (.sql, .db) 
+- Template files (.html with server-side code) 
+
+Understand what each piece of code does on the entire codebase and find any higher-level vulnerabilities as well. These vulnerabilities may occur from interactions from multiple files:
+- Incorrect authorization handling
+- Improper role checking
+ 
+IGNORE: Images, static assets, documentation, compiled binaries 
+ 
+The input has one section per file: a header line "=== <path> (<size> bytes)" followed by the file's content. A header ending in "content not fetched" has no content below it; classify that file from its path, name and size. Long files are shown as their beginning and end around a "...[TRUNCATED]..." marker; the size in the header is the whole file's. 
+ 
+Input: 
+\
+"""
+)
+
+
+def describe_risk_reason(code: Any, detail: Any = None) -> Any:
+    """Expands a reason code to its description; anything that isn't a code passes through."""
+    reason = RISK_REASON_CODES.get(code, code)
+    return f"{reason}: {detail}" if detail else reason
+
+
+# file_type is emitted as a single letter to save output tokens; VulnScannerMerge expands it back.
+FILE_TYPE_CODES = {
+    "W": "WEB_APP",
+    "A": "API",
+    "C": "CONFIG",
+    "D": "DATABASE",
+    "F": "FRONTEND",
+    "O": "OTHER",
+}
+
+# Developer-facing schema; the model is sent _SCANNER_WIRE_SCHEMA, which drops the docs.
+_SCANNER_FULL_SCHEMA = {
+    "type": "object",
+    "title": "File Classification Output",
+    "description": "Output schema for the file classification and filtering block",
+    "$defs": {
+        "ClassifiedFile": {
+            "type": "object",
+            "properties": {
+                "path": {"type": "string", "description": "Full file path"},
+                "file_type": {
+                    "type": "string",
+                    "enum": list(FILE_TYPE_CODES),
+                    "description": "Categorized file type code",
+                },
+                "language": {"type": "string", "description": "Programming language"},
+                "risk_reason": {
+                    "type": "string",
+                    "enum": list(RISK_REASON_CODES),
+                    "description": "Why this risk level",
+                },
+                "risk_reason_detail": {
+                    "type": "string",
+                    "maxLength": 80,
+                    "description": "Optional clarification of the reason code",
+                },
+            },
+            "required": [
+                "path",
+                "file_type",
+                "language",
+                "risk_reason",
+            ],
+        },
+        "IgnoredFile": {
+            "type": "object",
+            "properties": {
+                "path": {"type": "string", "description": "Full file path"},
+                "ignore_reason": {"type": "string", "description": "Why ignored"},
+            },
+            "required": [
+                "path",
+                "ignore_reason",
+            ],
+        },
+    },
+    "properties": {
+        "high_risk_files": {
+            "type": "array",
+            "description": "High risk files",
+            "items": {"$ref": "#/$defs/ClassifiedFile"},
+        },
+        "medium_risk_files": {
+            "type": "array",
+            "description": "Medium risk files",
+            "items": {"$ref": "#/$defs/ClassifiedFile"},
+        },
+        "low_risk_files": {
+            "type": "array",
+            "description": "Low risk files",
+            "items": {"$ref": "#/$defs/ClassifiedFile"},
+        },
+        "ignored_files": {
+            "type": "array",
+            "description": "Ignored files",
+            "items": {"$ref": "#/$defs/IgnoredFile"},
+        },
+    },
+    "required": [
+        "high_risk_files",
+        "medium_risk_files",
+        "low_risk_files",
+        "ignored_files",
+    ],
+}
+
+
+def _strip_descriptions(schema: Any) -> Any:
+    """Drops "title" and "description" annotations, leaving the structure the model must produce."""
+    if isinstance(schema, list):
+        return [_strip_descriptions(item) for item in schema]
+    if not isinstance(schema, dict):
+        return schema
+    return {
+        key: (
+            {name: _strip_descriptions(prop) for name, prop in value.items()}
+            if key in ("properties", "$defs")
+            else _strip_descriptions(value)
+        )
+        for key, value in schema.items()
+        if key not in ("title", "description")
+    }
+
+
+_SCANNER_WIRE_SCHEMA = _strip_descriptions(_SCANNER_FULL_SCHEMA)
+
+SCANNER_CUSTOM_PARAMS = {
+    "json_mode": True,
+    "json_schema": {
+        "name": "Scanner",
+        "schema": _SCANNER_WIRE_SCHEMA,
+    },
+}
+
+SCANNER_MODEL = "gpt-4o-mini"
+
+# Part of every scan_cache key: a change to the model, prompt or schema invalidates cached records.
+SCANNER_CACHE_SALT = hashlib.sha256(
+    json.dumps([SCANNER_MODEL, SCANNER_PREAMBLE, SCANNER_CUSTOM_PARAMS], sort_keys=True).encode("utf-8")
+).hexdigest()
+
+
+# The o4-mini review of HIGH files (VulnScannerDeepBatch). Same prefix-caching layout as the bulk
+# scanner: static preamble first, the variable block last.
+DEEP_PREAMBLE = (
+    """\
+You are a senior application security reviewer. A fast first-pass classifier marked the files below as HIGH security risk.
+
+For each file, read its content together with the list of every classified file in the repository, and decide whether it really is HIGH risk or should be MEDIUM. Long files are shown as their beginning and end around a "...[TRUNCATED]..." marker. Look especially for vulnerabilities that come from interactions between files:
+- Incorrect authorization handling
+- Improper role checking
+- Untrusted input crossing module boundaries without validation
+
+Return exactly one verdict per input file, with its path, the risk level (HIGH or MEDIUM), one reason code, and a risk_reason_detail only for a short clarification. Reason codes: \
+"""
+    + ", ".join(RISK_REASON_CODES)
+    + """
+
+Input:
+\
+"""
+)
+
+_DEEP_JSON_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "verdicts": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "path": {"type": "string"},
+                    "risk_level": {"type": "string", "enum": ["HIGH", "MEDIUM"]},
+                    "risk_reason": {"type": "string", "enum": list(RISK_REASON_CODES)},
+                    "risk_reason_detail": {"type": "string", "maxLength": 80},
+                },
+                "required": ["path", "risk_level", "risk_reason"],
+            },
+        },
+    },
+    "required": ["verdicts"],
+}
+
+DEEP_CUSTOM_PARAMS = {
+    "json_mode": True,
+    "json_schema": {
+        "name": "DeepScanner",
+        "schema": _DEEP_JSON_SCHEMA,
+    },
+    "reasoning_effort": "medium",
+}
+
+DEEP_MODEL = "o4-mini"
+
+# Part of every cached deep verdict's key, like SCANNER_CACHE_SALT for the bulk records.
+DEEP_CACHE_SALT = hashlib.sha256(
+    json.dumps([DEEP_MODEL, DEEP_PREAMBLE, DEEP_CUSTOM_PARAMS], sort_keys=True).encode("utf-8")
+).hexdigest()
@@ -0,0 +1,10 @@
+from vellum.workflows.nodes.displayable import MapNode
+
+from ..file_list_sharder import FileListSharder
+from .workflow import VulnScannerWorkflow
+
+
+class VulnScanner(MapNode):
+    items = FileListSharder.Outputs.shards
+    subworkflow = VulnScannerWorkflow
+    max_concurrency = 8
@@ -0,0 +1,9 @@
+from typing import List
+
+from vellum.workflows.inputs import BaseInputs
+
+
+class Inputs(BaseInputs):
+    items: List[str]
+    item: str
+    index: int
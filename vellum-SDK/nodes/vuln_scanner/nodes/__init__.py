@@ -0,0 +1,5 @@
+from .vuln_scanner_shard import VulnScannerShard
+
+__all__ = [
+    "VulnScannerShard",
+]
@@ -0,0 +1,55 @@
+from vellum import (
+    ChatMessagePromptBlock,
+    PlainTextPromptBlock,
+    PromptParameters,
+    PromptSettings,
+    RichTextPromptBlock,
+    VariablePromptBlock,
+)
+from vellum.workflows.nodes.displayable import InlinePromptNode
+
+from ...file_list_sharder import SHARD_SIZE
+from ...scanner_prompt import SCANNER_CUSTOM_PARAMS, SCANNER_MODEL, SCANNER_PREAMBLE
+from ..inputs import Inputs
+
+# Every shard holds at most SHARD_SIZE files, so the completion budget can be bounded per shard
+# instead of reserving a worst-case cap: ~120 tokens per classified record plus the JSON envelope.
+_RECORD_TOKENS = 120
+_ENVELOPE_TOKENS = 512
+_MAX_TOKENS = min(32768, _RECORD_TOKENS * SHARD_SIZE + _ENVELOPE_TOKENS)
+
+
+class VulnScannerShard(InlinePromptNode):
+    # Bulk first pass: classification is pattern matching, so it runs on a non-reasoning model and
+    # only the files it marks HIGH are re-examined by VulnScannerDeep.
+    ml_model = SCANNER_MODEL
+    blocks = [
+        ChatMessagePromptBlock(
+            chat_role="USER",
+            blocks=[
+                RichTextPromptBlock(
+                    blocks=[
+                        PlainTextPromptBlock(text=SCANNER_PREAMBLE),
+                        VariablePromptBlock(input_variable="fileList"),
+                    ]
+                )
+            ],
+        ),
+    ]
+    prompt_inputs = {
+        "fileList": Inputs.item,
+    }
+    parameters = PromptParameters(
+        stop=[],
+        temperature=None,
+        max_tokens=_MAX_TOKENS,
+        top_p=None,
+        top_k=None,
+        frequency_penalty=None,
+        presence_penalty=None,
+        logit_bias={},
+        custom_parameters=SCANNER_CUSTOM_PARAMS,
+    )
+    # Every consumer (VulnScannerMerge, via the map) waits for the complete JSON, so streaming would
+    # only add per-chunk event overhead. Enable it only once something consumes partial output.
+    settings = PromptSettings(stream_enabled=False)
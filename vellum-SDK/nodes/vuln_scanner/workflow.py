@@ -0,0 +1,12 @@
+from vellum.workflows import BaseWorkflow
+from vellum.workflows.state import BaseState
+
+from .inputs import Inputs
+from .nodes.vuln_scanner_shard import VulnScannerShard
+
+
+class VulnScannerWorkflow(BaseWorkflow[Inputs, BaseState]):
+    graph = VulnScannerShard
+
+    class Outputs(BaseWorkflow.Outputs):
+        json = VulnScannerShard.Outputs.json
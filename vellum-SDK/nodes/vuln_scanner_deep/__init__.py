@@ -0,0 +1,12 @@
+from vellum.workflows.nodes.displayable import MapNode
+
+from ..vuln_scanner_merge import VulnScannerMerge
+from .workflow import VulnScannerDeepWorkflow
+
+
+class VulnScannerDeep(MapNode):
+    # Second stage of the cascade: only the files the bulk pass marked HIGH reach the reasoning
+    # model. With no HIGH files there are no items and no calls.
+    items = VulnScannerMerge.Outputs.escalations
+    subworkflow = VulnScannerDeepWorkflow
+    max_concurrency = 4
@@ -0,0 +1,5 @@
+from .vuln_scanner_deep_batch import VulnScannerDeepBatch
+
+__all__ = [
+    "VulnScannerDeepBatch",
+]
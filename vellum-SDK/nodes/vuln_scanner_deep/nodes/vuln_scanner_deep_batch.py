@@ -0,0 +1,44 @@
+from vellum import (
+    ChatMessagePromptBlock,
+    PlainTextPromptBlock,
+    PromptParameters,
+    PromptSettings,
+    RichTextPromptBlock,
+    VariablePromptBlock,
+)
+from vellum.workflows.nodes.displayable import InlinePromptNode
+
+from ...scanner_prompt import DEEP_CUSTOM_PARAMS, DEEP_MODEL, DEEP_PREAMBLE
+from ..inputs import Inputs
+
+
+class VulnScannerDeepBatch(InlinePromptNode):
+    ml_model = DEEP_MODEL
+    blocks = [
+        ChatMessagePromptBlock(
+            chat_role="USER",
+            blocks=[
+                RichTextPromptBlock(
+                    blocks=[
+                        PlainTextPromptBlock(text=DEEP_PREAMBLE),
+                        VariablePromptBlock(input_variable="candidates"),
+                    ]
+                )
+            ],
+        ),
+    ]
+    prompt_inputs = {
+        "candidates": Inputs.item,
+    }
+    parameters = PromptParameters(
+        stop=[],
+        temperature=None,
+        max_tokens=16384,
+        top_p=None,
+        top_k=None,
+        frequency_penalty=None,
+        presence_penalty=None,
+        logit_bias={},
+        custom_parameters=DEEP_CUSTOM_PARAMS,
+    )
+    settings = PromptSettings(stream_enabled=False)
@@ -0,0 +1,12 @@
+from vellum.workflows import BaseWorkflow
+from vellum.workflows.state import BaseState
+
+from .inputs import Inputs
+from .nodes.vuln_scanner_deep_batch import VulnScannerDeepBatch
+
+
+class VulnScannerDeepWorkflow(BaseWorkflow[Inputs, BaseState]):
+    graph = VulnScannerDeepBatch
+
+    class Outputs(BaseWorkflow.Outputs):
+        json = VulnScannerDeepBatch.Outputs.json
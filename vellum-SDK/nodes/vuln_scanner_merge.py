@@ -0,0 +1,181 @@
+from typing import Any, Dict, List, Optional
+
+from vellum.workflows.nodes.bases import BaseNode
+
+from . import scan_cache
+from .file_list import FileList, _parent_folder
+from .file_list_sharder import truncate_middle
+from .scan_cache_lookup import SCANNED_GROUPS, ScanCacheLookup
+from .scanner_prompt import DEEP_CACHE_SALT, FILE_TYPE_CODES, describe_risk_reason
+from .vuln_scanner import VulnScanner
+
+_CLASSIFIED_GROUPS = ("high_risk_files", "medium_risk_files", "low_risk_files")
+
+# Bounds on one VulnScannerDeep call, so a few large HIGH files can't overflow the context window:
+# at most ESCALATION_BATCH_SIZE files and ESCALATION_BATCH_CHARS of content per batch, each file cut
+# to head + tail, and at most ESCALATION_REPOSITORY_PATHS paths of cross-file context.
+ESCALATION_BATCH_SIZE = 8
+ESCALATION_BATCH_CHARS = 96_000
+ESCALATION_FILE_HEAD_CHARS = 20_000
+ESCALATION_FILE_TAIL_CHARS = 4_000
+ESCALATION_REPOSITORY_PATHS = 2_000
+
+
+class VulnScannerMerge(BaseNode):
+    shard_results = VulnScanner.Outputs.json
+    cache_keys = ScanCacheLookup.Outputs.keys
+    cached_result = ScanCacheLookup.Outputs.cached
+    duplicates = FileList.Outputs.duplicates
+    prefiltered_ignored = FileList.Outputs.ignored
+    prefiltered_low_risk = FileList.Outputs.low_risk
+    files = FileList.Outputs.result
+
+    class Outputs(BaseNode.Outputs):
+        json: Dict[str, Any]
+        escalations: List[Dict[str, Any]]
+        # Path -> deep cache key for every escalated file, so VulnScannerReview can store its verdict.
+        deep_keys: Dict[str, str]
+        # Path -> cached deep verdict for HIGH files that are not escalated again.
+        cached_verdicts: Dict[str, Dict[str, Any]]
+
+    def run(self) -> Outputs:
+        # Each returned record is cached under its own file's key, so adding or removing a file
+        # doesn't invalidate the records of files that merely moved to another shard.
+        stored = False
+        for shard_result in self.shard_results:
+            for group in SCANNED_GROUPS:
+                for record in (shard_result or {}).get(group) or []:
+                    key = self.cache_keys.get(record.get("path"))
+                    if key:
+                        scan_cache.store(key, {"group": group, "record": record})
+                        stored = True
+        if stored:
+            scan_cache.prune()
+
+        merged: Dict[str, List[Dict[str, Any]]] = {group: [] for group in SCANNED_GROUPS}
+        for shard_result in [self.cached_result, *self.shard_results]:
+            if not shard_result:
+                continue
+            for group, files in merged.items():
+                files.extend(shard_result.get(group) or [])
+
+        # Stored above, so the records can be rewritten in place without touching the cached copies.
+        # The model only returns paths; name and parent_folder come from FileList, like every other
+        # record in the report.
+        locations = {file["path"]: file for file in self.files}
+        for files in merged.values():
+            for record in files:
+                _locate(record, locations.get(record.get("path")))
+        for group in _CLASSIFIED_GROUPS:
+            for record in merged[group]:
+                file_type = record.get("file_type")
+                record["file_type"] = FILE_TYPE_CODES.get(file_type, file_type)
+                record["risk_reason"] = describe_risk_reason(
+                    record.get("risk_reason"), record.pop("risk_reason_detail", None)
+                )
+
+        # A failed or truncated shard returns no usable JSON, and the model can also skip files. Any
+        # file with no record is reported as unscanned rather than silently missing from the counts.
+        returned = {record.get("path") for files in merged.values() for record in files}
+        unscanned = [
+            {"name": file["name"], "path": file["path"], "parent_folder": file["parent_folder"]}
+            for file in self.files
+            if file["path"] not in returned
+        ]
+
+        # A HIGH file whose deep verdict is cached (same content, same review prompt) isn't escalated
+        # again; VulnScannerReview applies the cached verdict instead.
+        deep_keys: Dict[str, str] = {}
+        cached_verdicts: Dict[str, Dict[str, Any]] = {}
+        escalated: List[Dict[str, Any]] = []
+        for record in merged["high_risk_files"]:
+            path = record.get("path")
+            file = locations.get(path)
+            key = scan_cache.file_key(DEEP_CACHE_SALT, path, file["content"], file.get("size")) if file else None
+            entry = scan_cache.load(key) if key else None
+            verdict = entry.get("verdict") if isinstance(entry, dict) else None
+            if isinstance(verdict, dict):
+                cached_verdicts[path] = verdict
+                continue
+            escalated.append(record)
+            if key:
+                deep_keys[path] = key
+        escalations = _escalation_batches(escalated, merged, self.files)
+
+        # Files that were deduplicated by content in FileList inherit their representative's record.
+        if self.duplicates:
+            for files in merged.values():
+                files.extend(
+                    _copy_for(record, duplicate)
+                    for record in list(files)
+                    for duplicate in self.duplicates.get(record.get("path"), ())
+                )
+            unscanned.extend(
+                duplicate for record in list(unscanned) for duplicate in self.duplicates.get(record["path"], ())
+            )
+
+        merged["low_risk_files"].extend(self.prefiltered_low_risk or [])
+        merged["ignored_files"].extend(self.prefiltered_ignored or [])
+        merged["unscanned_files"] = unscanned
+
+        return self.Outputs(
+            json={
+                **merged,
+                "classification_summary": {
+                    "total_files": sum(len(files) for files in merged.values()),
+                    "high_risk_count": len(merged["high_risk_files"]),
+                    "medium_risk_count": len(merged["medium_risk_files"]),
+                    "low_risk_count": len(merged["low_risk_files"]),
+                    "ignored_count": len(merged["ignored_files"]),
+                    "unscanned_count": len(merged["unscanned_files"]),
+                },
+            },
+            escalations=escalations,
+            deep_keys=deep_keys,
+            cached_verdicts=cached_verdicts,
+        )
+
+
+def _locate(record: Dict[str, Any], file: Optional[Dict[str, Any]]) -> None:
+    path = record.get("path") or ""
+    record["name"] = file["name"] if file else path.rpartition("/")[2]
+    if "ignore_reason" not in record:
+        record["parent_folder"] = file["parent_folder"] if file else _parent_folder(path)
+
+
+def _copy_for(record: Dict[str, Any], duplicate: Dict[str, str]) -> Dict[str, Any]:
+    # Only overwrite the location fields the record already has; ignored_files carry no parent_folder.
+    return {**record, **{key: value for key, value in duplicate.items() if key in record}}
+
+
+def _escalation_batches(
+    escalated: List[Dict[str, Any]], merged: Dict[str, List[Dict[str, Any]]], files: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    # Built before duplicates are fanned out, so each distinct file is reviewed once. Every batch
+    # carries the classified paths of the repository as cross-file context.
+    contents = {file["path"]: file.get("content") or "" for file in files}
+    repository = [record.get("path") for group in _CLASSIFIED_GROUPS for record in merged[group]]
+    repository = repository[:ESCALATION_REPOSITORY_PATHS]
+
+    batches: List[Dict[str, Any]] = []
+    batch: List[Dict[str, Any]] = []
+    batch_chars = 0
+    for record in escalated:
+        content = truncate_middle(
+            contents.get(record.get("path"), ""), ESCALATION_FILE_HEAD_CHARS, ESCALATION_FILE_TAIL_CHARS
+        )
+        if batch and (len(batch) == ESCALATION_BATCH_SIZE or batch_chars + len(content) > ESCALATION_BATCH_CHARS):
+            batches.append({"files": batch, "repository": repository})
+            batch, batch_chars = [], 0
+        batch.append(
+            {
+                "path": record.get("path"),
+                "language": record.get("language"),
+                "risk_reason": record.get("risk_reason"),
+                "content": content,
+            }
+        )
+        batch_chars += len(content)
+    if batch:
+        batches.append({"files": batch, "repository": repository})
+    return batches
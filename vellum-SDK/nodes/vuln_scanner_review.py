@@ -0,0 +1,70 @@
+from typing import Any, Dict, List
+
+from vellum.workflows.nodes.bases import BaseNode
+
+from . import scan_cache
+from .file_list import FileList
+from .scanner_prompt import describe_risk_reason
+from .vuln_scanner_deep import VulnScannerDeep
+from .vuln_scanner_merge import VulnScannerMerge
+
+
+class VulnScannerReview(BaseNode):
+    scan = VulnScannerMerge.Outputs.json
+    deep_results = VulnScannerDeep.Outputs.json
+    duplicates = FileList.Outputs.duplicates
+    deep_keys = VulnScannerMerge.Outputs.deep_keys
+    cached_verdicts = VulnScannerMerge.Outputs.cached_verdicts
+
+    class Outputs(BaseNode.Outputs):
+        json: Dict[str, Any]
+        # Routed here in the same pass for Patcher, so it doesn't select into the full result.
+        high_risk_files: List[Dict[str, Any]]
+
+    def run(self) -> Outputs:
+        verdicts: Dict[str, Dict[str, Any]] = dict(self.cached_verdicts or {})
+        stored = False
+        for deep_result in self.deep_results:
+            for verdict in (deep_result or {}).get("verdicts") or []:
+                path = verdict.get("path")
+                verdicts[path] = verdict
+                key = self.deep_keys.get(path)
+                if key:
+                    scan_cache.store(key, {"verdict": verdict})
+                    stored = True
+        if stored:
+            scan_cache.prune()
+        # Content duplicates were reviewed once, under their representative's path.
+        for path, copies in (self.duplicates or {}).items():
+            if path in verdicts:
+                for duplicate in copies:
+                    verdicts.setdefault(duplicate["path"], verdicts[path])
+        if not verdicts:
+            return self.Outputs(json=self.scan, high_risk_files=self.scan["high_risk_files"])
+
+        high_risk: List[Dict[str, Any]] = []
+        medium_risk = list(self.scan["medium_risk_files"])
+        for record in self.scan["high_risk_files"]:
+            verdict = verdicts.get(record.get("path"))
+            if verdict is None:
+                high_risk.append(record)
+                continue
+            record = {
+                **record,
+                "risk_reason": describe_risk_reason(verdict.get("risk_reason"), verdict.get("risk_reason_detail")),
+            }
+            (medium_risk if verdict.get("risk_level") == "MEDIUM" else high_risk).append(record)
+
+        return self.Outputs(
+            json={
+                **self.scan,
+                "high_risk_files": high_risk,
+                "medium_risk_files": medium_risk,
+                "classification_summary": {
+                    **self.scan["classification_summary"],
+                    "high_risk_count": len(high_risk),
+                    "medium_risk_count": len(medium_risk),
+                },
+            },
+            high_risk_files=high_risk,
+        )
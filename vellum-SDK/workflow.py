@@ -3,18 +3,29 @@ from vellum.workflows.state import BaseState
 
 from .inputs import Inputs
 from .nodes.file_list import FileList
+from .nodes.file_list_sharder import FileListSharder
 from .nodes.patcher import Patcher
+from .nodes.patcher_merge import PatcherMerge
 from .nodes.results import Results
+from .nodes.scan_cache_lookup import ScanCacheLookup
 from .nodes.scanned_files import ScannedFiles
 from .nodes.vuln_scanner import VulnScanner
+from .nodes.vuln_scanner_deep import VulnScannerDeep
+from .nodes.vuln_scanner_merge import VulnScannerMerge
+from .nodes.vuln_scanner_review import VulnScannerReview
 
 
 class Workflow(BaseWorkflow[Inputs, BaseState]):
     graph = (
         FileList
+        >> ScanCacheLookup
+        >> FileListSharder
         >> VulnScanner
+        >> VulnScannerMerge
+        >> VulnScannerDeep
+        >> VulnScannerReview
         >> {
-            Patcher >> Results,
+            Patcher >> PatcherMerge >> Results,
             ScannedFiles,
         }
     )